@@ -0,0 +1,275 @@
+/*
+Copyright 2023 The Matrix.org Foundation C.I.C.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
+/* Builds the test data for cryptography tests which is exported from `./index.ts`.
+ *
+ * Everything is derived from the fixed inputs in `TestUserData`, so the result is the same on every run.
+ */
+
+import anotherjson from "another-json";
+import { createHash, createPrivateKey, createPublicKey, KeyObject, sign } from "crypto";
+
+import { IDeviceKeys, IMegolmSessionData } from "../../../src/@types/crypto";
+import { IClaimOTKsResult, IDownloadKeyResult } from "../../../src";
+import { KeyBackupInfo } from "../../../src/crypto-api";
+
+/** The fixed inputs from which the test data for a single user is built */
+export interface TestUserData {
+    userId: string;
+    deviceId: string;
+    roomId: string;
+    /** any 32-byte string can be an ed25519 private key. */
+    devicePrivateKey: Uint8Array;
+    masterCrossSigningPrivateKey: Uint8Array;
+    userCrossSigningPrivateKey: Uint8Array;
+    selfCrossSigningPrivateKey: Uint8Array;
+    /** Private key for secure key backup. */
+    backupDecryptionKeyBase64: string;
+    /** The public part of a one-time key, which will be signed with the device key */
+    otk: string;
+}
+
+/** The test data for a single user. See `./index.ts` for a description of each field. */
+export interface TestData {
+    userId: string;
+    deviceId: string;
+    roomId: string;
+    devicePublicEd25519KeyBase64: string;
+    signedDeviceData: IDeviceKeys;
+    masterCrossSigningPublicKeyBase64: string;
+    masterCrossSigningPrivateKeyBase64: string;
+    selfCrossSigningPublicKeyBase64: string;
+    selfCrossSigningPrivateKeyBase64: string;
+    userCrossSigningPublicKeyBase64: string;
+    userCrossSigningPrivateKeyBase64: string;
+    signedCrossSigningKeysData: Partial<IDownloadKeyResult>;
+    backupDecryptionKeyBase64: string;
+    signedBackupData: KeyBackupInfo;
+    megolmSessionDataArray: IMegolmSessionData[];
+    megolmSessionData: IMegolmSessionData;
+    oneTimeKeys: IClaimOTKsResult["one_time_keys"];
+}
+
+/**
+ * Build the test data for the given user.
+ *
+ * @param userData - the fixed inputs for this user
+ */
+export function buildTestData(userData: TestUserData): TestData {
+    const { userId, deviceId } = userData;
+
+    const privateKey = ed25519PrivateKey(userData.devicePrivateKey);
+    const b64PublicKey = encodeUnpaddedBase64(publicKeyBytes(privateKey));
+    const deviceKeyId = `ed25519:${deviceId}`;
+
+    const deviceData: IDeviceKeys = {
+        algorithms: ["m.olm.v1.curve25519-aes-sha2", "m.megolm.v1.aes-sha2"],
+        device_id: deviceId,
+        keys: {
+            [`curve25519:${deviceId}`]: "F4uCNNlcbRvc7CfBz95ZGWBvY1ALniG1J8+6rhVoKS0",
+            [deviceKeyId]: b64PublicKey,
+        },
+        user_id: userId,
+    };
+    deviceData.signatures = { [userId]: { [deviceKeyId]: signJson(deviceData, privateKey) } };
+
+    const masterPrivateKey = ed25519PrivateKey(userData.masterCrossSigningPrivateKey);
+    const b64MasterPublicKey = encodeUnpaddedBase64(publicKeyBytes(masterPrivateKey));
+    const b64SelfSigningPublicKey = encodeUnpaddedBase64(
+        publicKeyBytes(ed25519PrivateKey(userData.selfCrossSigningPrivateKey)),
+    );
+    const b64UserSigningPublicKey = encodeUnpaddedBase64(
+        publicKeyBytes(ed25519PrivateKey(userData.userCrossSigningPrivateKey)),
+    );
+
+    const backupDecryptionKey = createPrivateKey({
+        key: Buffer.concat([X25519_PKCS8_PREFIX, Buffer.from(userData.backupDecryptionKeyBase64, "base64")]),
+        format: "der",
+        type: "pkcs8",
+    });
+    const backupData: KeyBackupInfo = {
+        algorithm: "m.megolm_backup.v1.curve25519-aes-sha2",
+        version: "1",
+        auth_data: {
+            public_key: encodeUnpaddedBase64(publicKeyBytes(backupDecryptionKey)),
+        },
+    };
+    // sign with our device key
+    backupData.auth_data.signatures = {
+        [userId]: { [deviceKeyId]: signJson(backupData.auth_data, privateKey) },
+    };
+
+    const megolmSessionDataArray = [
+        buildExportedMegolmKey(`${userId} megolm 0`),
+        buildExportedMegolmKey(`${userId} megolm 1`),
+    ];
+    const megolmSessionData = buildExportedMegolmKey(`${userId} megolm 2`);
+
+    // sign our public otk key with our device key
+    const otk = signJson({ key: userData.otk }, privateKey);
+    const oneTimeKeys = {
+        [userId]: {
+            [deviceId]: {
+                "signed_curve25519:AAAAHQ": {
+                    key: userData.otk,
+                    signatures: { [userId]: { [deviceKeyId]: otk } },
+                },
+            },
+        },
+    };
+
+    return {
+        userId,
+        deviceId,
+        roomId: userData.roomId,
+        devicePublicEd25519KeyBase64: b64PublicKey,
+        signedDeviceData: deviceData,
+        masterCrossSigningPublicKeyBase64: b64MasterPublicKey,
+        masterCrossSigningPrivateKeyBase64: encodeUnpaddedBase64(userData.masterCrossSigningPrivateKey),
+        selfCrossSigningPublicKeyBase64: b64SelfSigningPublicKey,
+        selfCrossSigningPrivateKeyBase64: encodeUnpaddedBase64(userData.selfCrossSigningPrivateKey),
+        userCrossSigningPublicKeyBase64: b64UserSigningPublicKey,
+        userCrossSigningPrivateKeyBase64: encodeUnpaddedBase64(userData.userCrossSigningPrivateKey),
+        signedCrossSigningKeysData: buildCrossSigningKeysData(
+            userId,
+            masterPrivateKey,
+            b64MasterPublicKey,
+            b64SelfSigningPublicKey,
+            b64UserSigningPublicKey,
+        ),
+        backupDecryptionKeyBase64: userData.backupDecryptionKeyBase64,
+        signedBackupData: backupData,
+        megolmSessionDataArray,
+        megolmSessionData,
+        oneTimeKeys,
+    };
+}
+
+/** Build the signed cross-signing-keys data for return from /keys/query */
+function buildCrossSigningKeysData(
+    userId: string,
+    masterPrivateKey: KeyObject,
+    b64MasterPublicKey: string,
+    b64SelfSigningPublicKey: string,
+    b64UserSigningPublicKey: string,
+): Partial<IDownloadKeyResult> {
+    const masterKeyId = `ed25519:${b64MasterPublicKey}`;
+
+    // sign the sub-keys with the master
+    const buildSubKey = (b64PublicKey: string, usage: string) => {
+        const subKey = {
+            keys: { [`ed25519:${b64PublicKey}`]: b64PublicKey },
+            user_id: userId,
+            usage: [usage],
+        };
+        return { ...subKey, signatures: { [userId]: { [masterKeyId]: signJson(subKey, masterPrivateKey) } } };
+    };
+
+    return {
+        master_keys: {
+            [userId]: {
+                keys: { [masterKeyId]: b64MasterPublicKey },
+                user_id: userId,
+                usage: ["master"],
+            },
+        },
+        self_signing_keys: {
+            [userId]: buildSubKey(b64SelfSigningPublicKey, "self_signing"),
+        },
+        user_signing_keys: {
+            [userId]: buildSubKey(b64UserSigningPublicKey, "user_signing"),
+        },
+    };
+}
+
+/**
+ * Creates an exported megolm room key, as per
+ * https://gitlab.matrix.org/matrix-org/olm/blob/master/docs/megolm.md#session-export-format,
+ * that can be imported via importRoomKeys API.
+ *
+ * @param label - a label which is unique to this session, from which its keys are derived
+ */
+function buildExportedMegolmKey(label: string): IMegolmSessionData {
+    const index = 0;
+    // 32 bytes for the session signing key, 32 * 4 for the ratchet parts and 32 for the sender's claimed signing key
+    const randomBytes = deterministicBytes(label, 32 + 32 * 4 + 32);
+    const publicKey = publicKeyBytes(ed25519PrivateKey(randomBytes.subarray(0, 32)));
+    // Just use random bytes for the ratchet parts
+    const ratchet = randomBytes.subarray(32, 160);
+    const indexBytes = Buffer.alloc(4);
+    indexBytes.writeUInt32BE(index);
+    // exported key: version byte, index, ratchet, KPub
+    const exportedKey = Buffer.concat([Buffer.from([1]), indexBytes, ratchet, publicKey]);
+
+    return {
+        algorithm: "m.megolm.v1.aes-sha2",
+        room_id: "!roomA:example.org",
+        sender_key: "/Bu9e34hUClhddpf4E5gu5qEAdMY31+1A9HbiAeeQgo",
+        session_id: encodeUnpaddedBase64(publicKey),
+        session_key: encodeUnpaddedBase64(exportedKey),
+        sender_claimed_keys: {
+            ed25519: encodeUnpaddedBase64(publicKeyBytes(ed25519PrivateKey(randomBytes.subarray(160, 192)))),
+        },
+        forwarding_curve25519_key_chain: [],
+    };
+}
+
+/**
+ * Generate `length` random-looking bytes which depend only on `label`, by concatenating `SHA-256(label:counter)`
+ * for counter = 0, 1, ...
+ */
+function deterministicBytes(label: string, length: number): Buffer {
+    const blocks: Buffer[] = [];
+    for (let counter = 0; blocks.length * 32 < length; counter++) {
+        blocks.push(createHash("sha256").update(`${label}:${counter}`).digest());
+    }
+    return Buffer.concat(blocks).subarray(0, length);
+}
+
+// DER prefixes which turn a raw 32-byte private key into a PKCS#8 structure that node's `crypto` can import.
+const ED25519_PKCS8_PREFIX = Buffer.from("302e020100300506032b657004220420", "hex");
+const X25519_PKCS8_PREFIX = Buffer.from("302e020100300506032b656e04220420", "hex");
+
+function ed25519PrivateKey(privateKeyBytes: Uint8Array): KeyObject {
+    return createPrivateKey({
+        key: Buffer.concat([ED25519_PKCS8_PREFIX, privateKeyBytes]),
+        format: "der",
+        type: "pkcs8",
+    });
+}
+
+/** Get the raw public key for an ed25519 or x25519 private key: the last 32 bytes of its SPKI encoding */
+function publicKeyBytes(privateKey: KeyObject): Buffer {
+    return createPublicKey(privateKey).export({ format: "der", type: "spki" }).subarray(-32);
+}
+
+function encodeUnpaddedBase64(bytes: Uint8Array): string {
+    return Buffer.from(bytes).toString("base64").replace(/=+$/, "");
+}
+
+/**
+ * Sign the given json object
+ *
+ * Returns the base64-encoded signature of signing `jsonObject` following the Matrix JSON signature algorithm, ignoring
+ * any existing `signatures` and `unsigned` properties.
+ *
+ * @see https://spec.matrix.org/v1.7/appendices/#signing-details
+ */
+function signJson(jsonObject: object, privateKey: KeyObject): string {
+    // eslint-disable-next-line @typescript-eslint/no-unused-vars
+    const { signatures, unsigned, ...toSign } = jsonObject as Record<string, any>;
+    return encodeUnpaddedBase64(sign(null, Buffer.from(anotherjson.stringify(toSign)), privateKey));
+}
@@ -1,341 +1,153 @@
+/*
+Copyright 2023 The Matrix.org Foundation C.I.C.
+
+Licensed under the Apache License, Version 2.0 (the "License");
+you may not use this file except in compliance with the License.
+You may obtain a copy of the License at
+
+    http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing, software
+distributed under the License is distributed on an "AS IS" BASIS,
+WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+See the License for the specific language governing permissions and
+limitations under the License.
+*/
+
 /* Test data for cryptography tests
  *
- * Do not edit by hand! This file is generated by `./generate-test-data.py`
+ * The data is built once, when this module is first loaded, by `./build-test-data.ts`.
  */
 
-import { IDeviceKeys, IMegolmSessionData } from "../../../src/@types/crypto";
-import { IDownloadKeyResult } from "../../../src";
-import { KeyBackupInfo } from "../../../src/crypto-api";
+import { buildTestData, TestUserData } from "./build-test-data";
+
+const ALICE_DATA: TestUserData = {
+    userId: "@alice:localhost",
+    deviceId: "test_device",
+    roomId: "!room:id",
+    devicePrivateKey: Buffer.from("deadbeefdeadbeefdeadbeefdeadbeef"),
+
+    masterCrossSigningPrivateKey: Buffer.from("doyouspeakwhaaaaaaaaaaaaaaaaaale"),
+    userCrossSigningPrivateKey: Buffer.from("useruseruseruseruseruseruseruser"),
+    selfCrossSigningPrivateKey: Buffer.from("selfselfselfselfselfselfselfself"),
+
+    // There are some sessions encrypted with this key in megolm-backup.spec.ts
+    backupDecryptionKeyBase64: "dwdtCnMYpX08FsFyUbJmRd9ML4frwJkqsXf7pR25LCo=",
 
-/* eslint-disable comma-dangle */
+    otk: "j3fR3HemM16M7CWhoI4Sk5ZsdmdfQHsKL1xuSft6MSw",
+};
+
+const BOB_DATA: TestUserData = {
+    userId: "@bob:xyz",
+    deviceId: "bob_device",
+    roomId: "!room:id",
+    devicePrivateKey: Buffer.from("Deadbeefdeadbeefdeadbeefdeadbeef"),
+
+    masterCrossSigningPrivateKey: Buffer.from("Doyouspeakwhaaaaaaaaaaaaaaaaaale"),
+    userCrossSigningPrivateKey: Buffer.from("Useruseruseruseruseruseruseruser"),
+    selfCrossSigningPrivateKey: Buffer.from("Selfselfselfselfselfselfselfself"),
+
+    // There are some sessions encrypted with this key in megolm-backup.spec.ts
+    backupDecryptionKeyBase64: "DwdtCnMYpX08FsFyUbJmRd9ML4frwJkqsXf7pR25LCo=",
+
+    otk: "j3fR3HemM16M7CWhoI4Sk5ZsdmdfQHsKL1xuSft6MSw",
+};
+
+const alice = buildTestData(ALICE_DATA);
+const bob = buildTestData(BOB_DATA);
 
 // Alice data
 
-export const TEST_USER_ID = "@alice:localhost";
-export const TEST_DEVICE_ID = "test_device";
-export const TEST_ROOM_ID = "!room:id";
+export const TEST_USER_ID = alice.userId;
+export const TEST_DEVICE_ID = alice.deviceId;
+export const TEST_ROOM_ID = alice.roomId;
 
 /** The base64-encoded public ed25519 key for this device */
-export const TEST_DEVICE_PUBLIC_ED25519_KEY_BASE64 = "YI/7vbGVLpGdYtuceQR8MSsKB/QjgfMXM1xqnn+0NWU";
+export const TEST_DEVICE_PUBLIC_ED25519_KEY_BASE64 = alice.devicePublicEd25519KeyBase64;
 
 /** Signed device data, suitable for returning from a `/keys/query` call */
-export const SIGNED_TEST_DEVICE_DATA: IDeviceKeys = {
-    "algorithms": [
-        "m.olm.v1.curve25519-aes-sha2",
-        "m.megolm.v1.aes-sha2"
-    ],
-    "device_id": "test_device",
-    "keys": {
-        "curve25519:test_device": "F4uCNNlcbRvc7CfBz95ZGWBvY1ALniG1J8+6rhVoKS0",
-        "ed25519:test_device": "YI/7vbGVLpGdYtuceQR8MSsKB/QjgfMXM1xqnn+0NWU"
-    },
-    "user_id": "@alice:localhost",
-    "signatures": {
-        "@alice:localhost": {
-            "ed25519:test_device": "LmQC/yAUZJmkxZ+3L0nEwvtVWOzjqQqADWBhk+C47SPaFYHeV+E291mgXaSCJVeGltX+HC49Aw7nb6ga7sw0Aw"
-        }
-    }
-};
+export const SIGNED_TEST_DEVICE_DATA = alice.signedDeviceData;
 
 /** base64-encoded public master cross-signing key */
-export const MASTER_CROSS_SIGNING_PUBLIC_KEY_BASE64 = "J+5An10v1vzZpAXTYFokD1/PEVccFnLC61EfRXit0UY";
+export const MASTER_CROSS_SIGNING_PUBLIC_KEY_BASE64 = alice.masterCrossSigningPublicKeyBase64;
 
 /** base64-encoded private master cross-signing key */
-export const MASTER_CROSS_SIGNING_PRIVATE_KEY_BASE64 = "ZG95b3VzcGVha3doYWFhYWFhYWFhYWFhYWFhYWFhbGU";
+export const MASTER_CROSS_SIGNING_PRIVATE_KEY_BASE64 = alice.masterCrossSigningPrivateKeyBase64;
 
 /** base64-encoded public self cross-signing key */
-export const SELF_CROSS_SIGNING_PUBLIC_KEY_BASE64 = "aU2+2CyXQTCuDcmWW0EL2bhJ6PdjFW2LbAsbHqf02AY";
+export const SELF_CROSS_SIGNING_PUBLIC_KEY_BASE64 = alice.selfCrossSigningPublicKeyBase64;
 
 /** base64-encoded private self signing cross-signing key */
-export const SELF_CROSS_SIGNING_PRIVATE_KEY_BASE64 = "c2VsZnNlbGZzZWxmc2VsZnNlbGZzZWxmc2VsZnNlbGY";
+export const SELF_CROSS_SIGNING_PRIVATE_KEY_BASE64 = alice.selfCrossSigningPrivateKeyBase64;
 
 /** base64-encoded public user cross-signing key */
-export const USER_CROSS_SIGNING_PUBLIC_KEY_BASE64 = "g5TC/zjQXyZYuDLZv7a41z5fFVrXpYPypG//AFQj8hY";
+export const USER_CROSS_SIGNING_PUBLIC_KEY_BASE64 = alice.userCrossSigningPublicKeyBase64;
 
 /** base64-encoded private user signing cross-signing key */
-export const USER_CROSS_SIGNING_PRIVATE_KEY_BASE64 = "dXNlcnVzZXJ1c2VydXNlcnVzZXJ1c2VydXNlcnVzZXI";
+export const USER_CROSS_SIGNING_PRIVATE_KEY_BASE64 = alice.userCrossSigningPrivateKeyBase64;
 
 /** Signed cross-signing keys data, also suitable for returning from a `/keys/query` call */
-export const SIGNED_CROSS_SIGNING_KEYS_DATA: Partial<IDownloadKeyResult> = {
-    "master_keys": {
-        "@alice:localhost": {
-            "keys": {
-                "ed25519:J+5An10v1vzZpAXTYFokD1/PEVccFnLC61EfRXit0UY": "J+5An10v1vzZpAXTYFokD1/PEVccFnLC61EfRXit0UY"
-            },
-            "user_id": "@alice:localhost",
-            "usage": [
-                "master"
-            ]
-        }
-    },
-    "self_signing_keys": {
-        "@alice:localhost": {
-            "keys": {
-                "ed25519:aU2+2CyXQTCuDcmWW0EL2bhJ6PdjFW2LbAsbHqf02AY": "aU2+2CyXQTCuDcmWW0EL2bhJ6PdjFW2LbAsbHqf02AY"
-            },
-            "user_id": "@alice:localhost",
-            "usage": [
-                "self_signing"
-            ],
-            "signatures": {
-                "@alice:localhost": {
-                    "ed25519:J+5An10v1vzZpAXTYFokD1/PEVccFnLC61EfRXit0UY": "XfhYEhZmOs8BJdb3viatILBZ/bElsHXEW28V4tIaY5CxrBR0YOym3yZHWmRmypXessHZAKOhZn3yBMXzdajyCw"
-                }
-            }
-        }
-    },
-    "user_signing_keys": {
-        "@alice:localhost": {
-            "keys": {
-                "ed25519:g5TC/zjQXyZYuDLZv7a41z5fFVrXpYPypG//AFQj8hY": "g5TC/zjQXyZYuDLZv7a41z5fFVrXpYPypG//AFQj8hY"
-            },
-            "user_id": "@alice:localhost",
-            "usage": [
-                "user_signing"
-            ],
-            "signatures": {
-                "@alice:localhost": {
-                    "ed25519:J+5An10v1vzZpAXTYFokD1/PEVccFnLC61EfRXit0UY": "6AkD1XM2H0/ebgP9oBdMKNeft7uxsrb0XN1CsjjHgeZCvCTMmv3BHlLiT/Hzy4fe8H+S1tr484dcXN/PIdnfDA"
-                }
-            }
-        }
-    }
-};
+export const SIGNED_CROSS_SIGNING_KEYS_DATA = alice.signedCrossSigningKeysData;
 
 /** base64-encoded backup decryption (private) key */
-export const BACKUP_DECRYPTION_KEY_BASE64 = "dwdtCnMYpX08FsFyUbJmRd9ML4frwJkqsXf7pR25LCo=";
+export const BACKUP_DECRYPTION_KEY_BASE64 = alice.backupDecryptionKeyBase64;
 
 /** Signed backup data, suitable for return from `GET /_matrix/client/v3/room_keys/keys/{roomId}/{sessionId}` */
-export const SIGNED_BACKUP_DATA: KeyBackupInfo = {
-    "algorithm": "m.megolm_backup.v1.curve25519-aes-sha2",
-    "version": "1",
-    "auth_data": {
-        "public_key": "hSDwCYkwp1R0i33ctD73Wg2/Og0mOBr066SpjqqbTmo",
-        "signatures": {
-            "@alice:localhost": {
-                "ed25519:test_device": "KDSNeumirTsd8piI0oVfv/wzg4J4HlEc7rs5XhODFcJ/YAcUdg65ajsZG+rLI0TQOSSGjorJqcrSiSB1HRSCAA"
-            }
-        }
-    }
-};
+export const SIGNED_BACKUP_DATA = alice.signedBackupData;
 
 /** A set of megolm keys that can be imported via CryptoAPI#importRoomKeys */
-export const MEGOLM_SESSION_DATA_ARRAY: IMegolmSessionData[] = [
-    {
-        "algorithm": "m.megolm.v1.aes-sha2",
-        "room_id": "!roomA:example.org",
-        "sender_key": "/Bu9e34hUClhddpf4E5gu5qEAdMY31+1A9HbiAeeQgo",
-        "session_id": "FYOoKQSwe4d9jhTZ/LQCZFJINjPEqZ7Or4Z08reP92M",
-        "session_key": "AQAAAABZ0jXQOprFfXe41tIFmAtHxflJp4O2hM/vzQQpOazOCFeWSoW5P3Z9Q+voU3eXehMwyP8/hm/Q8xLP6/PmJdy+71se/17kdFwcDGgLxBWfa4ODM9zlI4EjKbNqmiii5loJ7rBhA/XXaw80m0hfU6zTDX/KrO55J0Pt4vJ0LDa3LBWDqCkEsHuHfY4U2fy0AmRSSDYzxKmezq+GdPK3j/dj",
-        "sender_claimed_keys": {
-            "ed25519": "QdgHgdpDgihgovpPzUiThXur1fbErTFh7paFvNKSgN0"
-        },
-        "forwarding_curve25519_key_chain": []
-    },
-    {
-        "algorithm": "m.megolm.v1.aes-sha2",
-        "room_id": "!roomA:example.org",
-        "sender_key": "/Bu9e34hUClhddpf4E5gu5qEAdMY31+1A9HbiAeeQgo",
-        "session_id": "mPYSGA2l1tOQiipEDEVYhDSdTSFh2lDW1qpGKYZRxTc",
-        "session_key": "AQAAAAAHwgkB49BTPAEGTCK6degxUIbl8GPG2ugPRYhNtOpNic63u11+baXFfjDw5fmVfD1gJXpQQjGsqrIYioxrB1xzl7mfb942UHhYdaMQZowpp1fSpJVsxR5TddUU2EWifYD9EQsoz8mY1zqoazm4vUP4v9yxaTcUBj2c6HMJCY0gCJj2EhgNpdbTkIoqRAxFWIQ0nU0hYdpQ1taqRimGUcU3",
-        "sender_claimed_keys": {
-            "ed25519": "IrkbT6H+0urDf6wKDSyVC1fh1t84Vz6T62snni86Cog"
-        },
-        "forwarding_curve25519_key_chain": []
-    }
-];
+export const MEGOLM_SESSION_DATA_ARRAY = alice.megolmSessionDataArray;
 
 /** An exported megolm session */
-export const MEGOLM_SESSION_DATA: IMegolmSessionData = {
-    "algorithm": "m.megolm.v1.aes-sha2",
-    "room_id": "!roomA:example.org",
-    "sender_key": "/Bu9e34hUClhddpf4E5gu5qEAdMY31+1A9HbiAeeQgo",
-    "session_id": "ipdI6Zs/7DzFTEhiA2iGaMDfHkIYCleqXT6L+5e1/co",
-    "session_key": "AQAAAABXGO+Z9jlQJhIL6ByhXrv2BwCIxkhh7MXpKLsYmXkJcWrQlirmXmD79ga1zo+I4DCtEZzyGSpDWXBC6G7ez3H4gDMBam1RE3Jm5tc+oTlIri32UkYgSL0kBkcEnttqmIXBlK8tAfJo3cJnlh7F4ltEOAqrdME6dU0zXTkqXmURqYqXSOmbP+w8xUxIYgNohmjA3x5CGApXql0+i/uXtf3K",
-    "sender_claimed_keys": {
-        "ed25519": "Bhbpt6hqMZlSH4sJV7xiEEEiPVeTWz4Vkujl1EMdIPI"
-    },
-    "forwarding_curve25519_key_chain": []
-};
+export const MEGOLM_SESSION_DATA = alice.megolmSessionData;
 
 /** Signed OTKs, returned by `POST /keys/claim` */
-export const ONE_TIME_KEYS = {
-    "@alice:localhost": {
-        "test_device": {
-            "signed_curve25519:AAAAHQ": {
-                "key": "j3fR3HemM16M7CWhoI4Sk5ZsdmdfQHsKL1xuSft6MSw",
-                "signatures": {
-                    "@alice:localhost": {
-                        "ed25519:test_device": "25djC6Rk6gIgFBMVawY9X9LnY8XMMziey6lKqL8Q5Bbp7T1vw9uk0RE7eKO2a/jNLcYroO2xRztGhBrKz5sOCQ"
-                    }
-                }
-            }
-        }
-    }
-};
+export const ONE_TIME_KEYS = alice.oneTimeKeys;
 
 // Bob data
 
-export const BOB_TEST_USER_ID = "@bob:xyz";
-export const BOB_TEST_DEVICE_ID = "bob_device";
-export const BOB_TEST_ROOM_ID = "!room:id";
+export const BOB_TEST_USER_ID = bob.userId;
+export const BOB_TEST_DEVICE_ID = bob.deviceId;
+export const BOB_TEST_ROOM_ID = bob.roomId;
 
 /** The base64-encoded public ed25519 key for this device */
-export const BOB_TEST_DEVICE_PUBLIC_ED25519_KEY_BASE64 = "jmY0h8QS6Te6gxyjOmMc0eKOqmbAtXpVo4CCWFubk50";
+export const BOB_TEST_DEVICE_PUBLIC_ED25519_KEY_BASE64 = bob.devicePublicEd25519KeyBase64;
 
 /** Signed device data, suitable for returning from a `/keys/query` call */
-export const BOB_SIGNED_TEST_DEVICE_DATA: IDeviceKeys = {
-    "algorithms": [
-        "m.olm.v1.curve25519-aes-sha2",
-        "m.megolm.v1.aes-sha2"
-    ],
-    "device_id": "bob_device",
-    "keys": {
-        "curve25519:bob_device": "F4uCNNlcbRvc7CfBz95ZGWBvY1ALniG1J8+6rhVoKS0",
-        "ed25519:bob_device": "jmY0h8QS6Te6gxyjOmMc0eKOqmbAtXpVo4CCWFubk50"
-    },
-    "user_id": "@bob:xyz",
-    "signatures": {
-        "@bob:xyz": {
-            "ed25519:bob_device": "4ApBs9jaeGyfdYaWRUdBvQAkDyXjACJ9KJ0xLHMgiFT/1yo6VqPTx2iziKGnrBiGhbtKNxEhDPOvZZkBU73cDQ"
-        }
-    }
-};
+export const BOB_SIGNED_TEST_DEVICE_DATA = bob.signedDeviceData;
 
 /** base64-encoded public master cross-signing key */
-export const BOB_MASTER_CROSS_SIGNING_PUBLIC_KEY_BASE64 = "KKVOHOB2LsW7hFJwqyzXpA+vp7u5+gaMWUJvBS7mjuA";
+export const BOB_MASTER_CROSS_SIGNING_PUBLIC_KEY_BASE64 = bob.masterCrossSigningPublicKeyBase64;
 
 /** base64-encoded private master cross-signing key */
-export const BOB_MASTER_CROSS_SIGNING_PRIVATE_KEY_BASE64 = "RG95b3VzcGVha3doYWFhYWFhYWFhYWFhYWFhYWFhbGU";
+export const BOB_MASTER_CROSS_SIGNING_PRIVATE_KEY_BASE64 = bob.masterCrossSigningPrivateKeyBase64;
 
 /** base64-encoded public self cross-signing key */
-export const BOB_SELF_CROSS_SIGNING_PUBLIC_KEY_BASE64 = "DaScI3WulBvDjf/d2vdyP5Cgjdypn1c/PSDX23MgN+A";
+export const BOB_SELF_CROSS_SIGNING_PUBLIC_KEY_BASE64 = bob.selfCrossSigningPublicKeyBase64;
 
 /** base64-encoded private self signing cross-signing key */
-export const BOB_SELF_CROSS_SIGNING_PRIVATE_KEY_BASE64 = "U2VsZnNlbGZzZWxmc2VsZnNlbGZzZWxmc2VsZnNlbGY";
+export const BOB_SELF_CROSS_SIGNING_PRIVATE_KEY_BASE64 = bob.selfCrossSigningPrivateKeyBase64;
 
 /** base64-encoded public user cross-signing key */
-export const BOB_USER_CROSS_SIGNING_PUBLIC_KEY_BASE64 = "lXP89FP6zvFH9TSbU1S8uSdAsVawm1NmV6z+Rfr3lEw";
+export const BOB_USER_CROSS_SIGNING_PUBLIC_KEY_BASE64 = bob.userCrossSigningPublicKeyBase64;
 
 /** base64-encoded private user signing cross-signing key */
-export const BOB_USER_CROSS_SIGNING_PRIVATE_KEY_BASE64 = "VXNlcnVzZXJ1c2VydXNlcnVzZXJ1c2VydXNlcnVzZXI";
+export const BOB_USER_CROSS_SIGNING_PRIVATE_KEY_BASE64 = bob.userCrossSigningPrivateKeyBase64;
 
 /** Signed cross-signing keys data, also suitable for returning from a `/keys/query` call */
-export const BOB_SIGNED_CROSS_SIGNING_KEYS_DATA: Partial<IDownloadKeyResult> = {
-    "master_keys": {
-        "@bob:xyz": {
-            "keys": {
-                "ed25519:KKVOHOB2LsW7hFJwqyzXpA+vp7u5+gaMWUJvBS7mjuA": "KKVOHOB2LsW7hFJwqyzXpA+vp7u5+gaMWUJvBS7mjuA"
-            },
-            "user_id": "@bob:xyz",
-            "usage": [
-                "master"
-            ]
-        }
-    },
-    "self_signing_keys": {
-        "@bob:xyz": {
-            "keys": {
-                "ed25519:DaScI3WulBvDjf/d2vdyP5Cgjdypn1c/PSDX23MgN+A": "DaScI3WulBvDjf/d2vdyP5Cgjdypn1c/PSDX23MgN+A"
-            },
-            "user_id": "@bob:xyz",
-            "usage": [
-                "self_signing"
-            ],
-            "signatures": {
-                "@bob:xyz": {
-                    "ed25519:KKVOHOB2LsW7hFJwqyzXpA+vp7u5+gaMWUJvBS7mjuA": "RxM8iJU6ZkyzQSVtNnXIJMPyEahVsN+fQQTBNKAs+kqySFyXBgchx+8czZaAhJCpXh9gD1nskT4yyFd2eyUXBw"
-                }
-            }
-        }
-    },
-    "user_signing_keys": {
-        "@bob:xyz": {
-            "keys": {
-                "ed25519:lXP89FP6zvFH9TSbU1S8uSdAsVawm1NmV6z+Rfr3lEw": "lXP89FP6zvFH9TSbU1S8uSdAsVawm1NmV6z+Rfr3lEw"
-            },
-            "user_id": "@bob:xyz",
-            "usage": [
-                "user_signing"
-            ],
-            "signatures": {
-                "@bob:xyz": {
-                    "ed25519:KKVOHOB2LsW7hFJwqyzXpA+vp7u5+gaMWUJvBS7mjuA": "jF8fvnPZulrPyh/4E8dNDVBP3iHHl9bRc+rRArVyGzoom+uVrokOck7BN2YmPyCRFZJJx7fgRA1Bveyu+mTVAg"
-                }
-            }
-        }
-    }
-};
+export const BOB_SIGNED_CROSS_SIGNING_KEYS_DATA = bob.signedCrossSigningKeysData;
 
 /** base64-encoded backup decryption (private) key */
-export const BOB_BACKUP_DECRYPTION_KEY_BASE64 = "DwdtCnMYpX08FsFyUbJmRd9ML4frwJkqsXf7pR25LCo=";
+export const BOB_BACKUP_DECRYPTION_KEY_BASE64 = bob.backupDecryptionKeyBase64;
 
 /** Signed backup data, suitable for return from `GET /_matrix/client/v3/room_keys/keys/{roomId}/{sessionId}` */
-export const BOB_SIGNED_BACKUP_DATA: KeyBackupInfo = {
-    "algorithm": "m.megolm_backup.v1.curve25519-aes-sha2",
-    "version": "1",
-    "auth_data": {
-        "public_key": "ZRuVWcWlDuvOwZRygccUCD4Avtnt130800I+WQNwwRY",
-        "signatures": {
-            "@bob:xyz": {
-                "ed25519:bob_device": "lDIMj3VC0WazE2FamGHpmbiqKf9Z4pO4qapZ5TL5BnD3c+dvb+2waOEd6pgay/pmrQ6MW4Eu2KDEpe1fnHc3BA"
-            }
-        }
-    }
-};
+export const BOB_SIGNED_BACKUP_DATA = bob.signedBackupData;
 
 /** A set of megolm keys that can be imported via CryptoAPI#importRoomKeys */
-export const BOB_MEGOLM_SESSION_DATA_ARRAY: IMegolmSessionData[] = [
-    {
-        "algorithm": "m.megolm.v1.aes-sha2",
-        "room_id": "!roomA:example.org",
-        "sender_key": "/Bu9e34hUClhddpf4E5gu5qEAdMY31+1A9HbiAeeQgo",
-        "session_id": "X9SK5JceUdvUr9gZkmdfS78qmKztoL60oORJ9JA5XD8",
-        "session_key": "AQAAAADbfOdUj/ec5bK4xVEhhRw+jfd1FD4uA0MLy7NyVHugZxyXNZUx5YEof4H9YyjBretviZreMSXqflbgYKz257rkKu7MPeKFf7zmln2GxX0F/p++GOnvpY1FqOglhfRQi3tqiyOa7SL4f7TuERDTOpMqlWhIfTKQnqy0AyF2vpDi5V/UiuSXHlHb1K/YGZJnX0u/Kpis7aC+tKDkSfSQOVw/",
-        "sender_claimed_keys": {
-            "ed25519": "ZG6lrfATe+958wN1xaGf3dKG/CThEfkmNdp1jcu4zok"
-        },
-        "forwarding_curve25519_key_chain": []
-    },
-    {
-        "algorithm": "m.megolm.v1.aes-sha2",
-        "room_id": "!roomA:example.org",
-        "sender_key": "/Bu9e34hUClhddpf4E5gu5qEAdMY31+1A9HbiAeeQgo",
-        "session_id": "F4P7f1Z0RjbiZMgHk1xBCG3KC4/Ng9PmxLJ4hQ13sHA",
-        "session_key": "AQAAAACv0khqPrQ91MmWCgm0RTzfpn65AGCrRnAKLxGJdfSfECNZ8gyj34FZLwi+F+xC6ibFddcbLXW0mzR6PnTnHF3VHM4g/h+2rcxtlix8fySpIwFzaXViba7cOSy/b+dHTMZB40iA7F4y7AdTdHLv4N1XUj3puU/KVUIKf9/lEDLqyReD+39WdEY24mTIB5NcQQhtyguPzYPT5sSyeIUNd7Bw",
-        "sender_claimed_keys": {
-            "ed25519": "HxUKnGfeUu0fF3cLyCFSDXYtVCQHy/+33q9RkzKfsiU"
-        },
-        "forwarding_curve25519_key_chain": []
-    }
-];
+export const BOB_MEGOLM_SESSION_DATA_ARRAY = bob.megolmSessionDataArray;
 
 /** An exported megolm session */
-export const BOB_MEGOLM_SESSION_DATA: IMegolmSessionData = {
-    "algorithm": "m.megolm.v1.aes-sha2",
-    "room_id": "!roomA:example.org",
-    "sender_key": "/Bu9e34hUClhddpf4E5gu5qEAdMY31+1A9HbiAeeQgo",
-    "session_id": "OsZMdC1gQ5nPr+L9tuT6xXsaFJkVPkgxP2FexHF1/QM",
-    "session_key": "AQAAAACvcoGk7mOY59fOqZaxFUiTCBRV1Ia94KBjAZx6kgdgBtkkvs50z8od8/Nc9ncK2UsEiXNvCTTp2dlN3du+Rx0/m7vet2ZOEEp2oYDjHMLLFmwd1gtlGuWYPdXA6Y1+9Yyph0/EDVfS+zd3XvbL0QgbyL43+yQnFNHKlxVJX1eiKTrGTHQtYEOZz6/i/bbk+sV7GhSZFT5IMT9hXsRxdf0D",
-    "sender_claimed_keys": {
-        "ed25519": "dV0TIhhkToXpL+gZLo+zXDHJfw7MWYxpg80cynIQDv0"
-    },
-    "forwarding_curve25519_key_chain": []
-};
+export const BOB_MEGOLM_SESSION_DATA = bob.megolmSessionData;
 
 /** Signed OTKs, returned by `POST /keys/claim` */
-export const BOB_ONE_TIME_KEYS = {
-    "@bob:xyz": {
-        "bob_device": {
-            "signed_curve25519:AAAAHQ": {
-                "key": "j3fR3HemM16M7CWhoI4Sk5ZsdmdfQHsKL1xuSft6MSw",
-                "signatures": {
-                    "@bob:xyz": {
-                        "ed25519:bob_device": "dlZc9VA/hP980Mxvu9qwi0qJx8VK7sADGOM48CE01YM7K/Mbty9lis/QjtQAWqDg371QyynVRjEzt9qj7eSFCg"
-                    }
-                }
-            }
-        }
-    }
-};
-
+export const BOB_ONE_TIME_KEYS = bob.oneTimeKeys;